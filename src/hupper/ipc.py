@@ -125,14 +125,16 @@ class Connection(object):
         self.r_fd = open_handle(state['r_handle'], 'rb')
         self.w_fd = open_handle(state['w_handle'], 'wb')
 
-    def activate(self, on_recv):
+    def activate(self, on_recv=None):
         self.on_recv = on_recv
 
         self.send_lock = threading.Lock()
 
-        self.reader_thread = threading.Thread(target=self._read_loop)
-        self.reader_thread.daemon = True
-        self.reader_thread.start()
+        # a connection may be send-only if the reader is managed elsewhere
+        if on_recv is not None:
+            self.reader_thread = threading.Thread(target=self._read_loop)
+            self.reader_thread.daemon = True
+            self.reader_thread.start()
 
     def close(self):
         close_fd(self.r_fd)
@@ -175,10 +177,11 @@ class Connection(object):
 
     def send(self, value):
         data = pickle.dumps(value)
+        # write the header and payload together to use a single syscall
+        packet = self._packet_len.pack(len(data)) + data
         with self.send_lock:
-            self._write_packet(self._packet_len.pack(len(data)))
-            self._write_packet(data)
-        return len(data) + self._packet_len.size
+            self._write_packet(packet)
+        return len(packet)
 
 
 def set_inheritable(fd, inheritable):
@@ -304,6 +307,10 @@ def spawn(spec, kwargs, pass_fds=()):
     to_child.write(pickle.dumps([preparation_data, spec, kwargs]))
     to_child.close()
 
+    # the child has its own copy of the read end now, keeping ours open
+    # leaks a descriptor per spawn which every later child also inherits
+    close_fd(r)
+
     return process
 
 
@@ -15,20 +15,39 @@ class PollingFileMonitor(threading.Thread, IFileMonitor):
     ``interval`` is a value in seconds between scans of the files on disk.
     Do not set this too low or it will eat your CPU and kill your drive.
 
+    ``logger`` is an optional :class:`hupper.interfaces.ILogger` instance.
+    A message is logged recommending a more efficient monitor if more than
+    ``max_paths_warning`` files are being watched.
+
     """
 
-    def __init__(self, callback, interval=1, **kw):
+    max_paths_warning = 1000
+
+    def __init__(self, callback, interval=1, logger=None, **kw):
         super(PollingFileMonitor, self).__init__()
         self.callback = callback
         self.poll_interval = interval
+        self.logger = logger
         self.paths = set()
         self.mtimes = {}
         self.lock = threading.Lock()
         self.enabled = True
+        self.warned = False
 
     def add_path(self, path):
         with self.lock:
             self.paths.add(path)
+            if (
+                not self.warned
+                and self.logger is not None
+                and len(self.paths) > self.max_paths_warning
+            ):
+                self.warned = True
+                self.logger.info(
+                    'Polling {} files for changes, install watchdog '
+                    '("pip install watchdog") for a more efficient file '
+                    'monitor.'.format(len(self.paths))
+                )
 
     def run(self):
         while self.enabled:
@@ -4,6 +4,7 @@ import fnmatch
 from glob import glob
 import os
 import re
+import select
 import signal
 import sys
 import threading
@@ -31,9 +32,14 @@ class FileMonitorProxy(object):
     exposes a thread-safe interface back to the reloader to detect
     when it should reload.
 
+    Changes are collected for ``debounce_interval`` seconds such that a
+    burst of events, such as an editor writing several files, is reported
+    as a single change.
+
     """
 
     monitor = None
+    debounce_interval = 0.005
 
     def __init__(self, callback, logger, ignore_files=None):
         self.callback = callback
@@ -45,6 +51,10 @@ class FileMonitorProxy(object):
         self.lock = threading.Lock()
         self.is_changed = False
 
+        # a dict is used as an ordered set to report paths in arrival order
+        self.pending_paths = {}
+        self.flush_timer = None
+
     def add_path(self, path):
         # if the glob does not match any files then go ahead and pass
         # the pattern to the monitor anyway incase it is just a file that
@@ -59,22 +69,62 @@ class FileMonitorProxy(object):
     def stop(self):
         self.monitor.stop()
         self.monitor.join()
+        with self.lock:
+            self._cancel_flush()
+            self.pending_paths = {}
 
     def file_changed(self, path):
+        # monitors tend to report the same path many times in a burst, skip
+        # the lock for those as set membership is atomic under the GIL
+        if path in self.changed_paths or path in self.pending_paths:
+            return
+
         with self.lock:
-            if path not in self.changed_paths:
-                self.logger.info('{} changed; reloading ...'.format(path))
-                self.changed_paths.add(path)
+            self.pending_paths[path] = None
+            if self.flush_timer is None:
+                self.flush_timer = threading.Timer(
+                    self.debounce_interval, self.flush_changes
+                )
+                self.flush_timer.daemon = True
+                self.flush_timer.start()
 
-                if not self.is_changed:
-                    self.is_changed = True
-                    self.callback(self.changed_paths)
+    def flush_changes(self):
+        with self.lock:
+            self._cancel_flush()
+            new_paths = [
+                path
+                for path in self.pending_paths
+                if path not in self.changed_paths
+            ]
+            self.pending_paths = {}
+            if not new_paths:
+                return
+
+            if len(new_paths) == 1:
+                msg = '{} changed; reloading ...'.format(new_paths[0])
+            else:
+                msg = '{} files changed (first: {}); reloading ...'.format(
+                    len(new_paths), new_paths[0]
+                )
+            self.logger.info(msg)
+            self.changed_paths.update(new_paths)
+
+            if not self.is_changed:
+                self.is_changed = True
+                self.callback(self.changed_paths)
 
     def clear_changes(self):
         with self.lock:
+            self._cancel_flush()
+            self.pending_paths = {}
             self.changed_paths = set()
             self.is_changed = False
 
+    def _cancel_flush(self):
+        if self.flush_timer is not None:
+            self.flush_timer.cancel()
+            self.flush_timer = None
+
 
 class ControlSignal:
     byte = lambda x: chr(x).encode('ascii')
@@ -139,14 +189,14 @@ class Reloader(object):
         with self._setup_runtime():
             while True:
                 result = self._run_worker()
-                start = time.time()
+                start = time.monotonic()
                 if result == WorkerResult.WAIT:
                     result = self._wait_for_changes()
+                if result != WorkerResult.EXIT:
+                    dt = self.reload_interval - (time.monotonic() - start)
+                    result = self._throttle(dt)
                 if result == WorkerResult.EXIT:
                     break
-                dt = self.reload_interval - (time.time() - start)
-                if dt > 0:
-                    time.sleep(dt)
         sys.exit(1)
 
     def run_once(self):
@@ -174,6 +224,49 @@ class Reloader(object):
             shutdown_interval=0,
         )
 
+    def _throttle(self, timeout):
+        """
+        Wait up to ``timeout`` seconds before reloading while still reacting
+        to control signals.
+
+        Returns ``WorkerResult.EXIT`` if a shutdown was requested.
+
+        """
+        deadline = time.monotonic() + timeout
+        while timeout > 0:
+            if WIN:  # pragma: no cover
+                # select() does not support pipes on windows
+                time.sleep(timeout)
+                break
+
+            ready, _, _ = select.select([self.control_r], [], [], timeout)
+            if ready:
+                signal = os.read(self.control_r, 1)
+                if not signal:
+                    self.logger.error('Control pipe died unexpectedly.')
+                    return WorkerResult.EXIT
+
+                elif signal == ControlSignal.SIGINT:
+                    # there is no server running to wait for
+                    self.logger.info('Received SIGINT, triggering a shutdown.')
+                    return WorkerResult.EXIT
+
+                elif signal == ControlSignal.SIGTERM:
+                    self.logger.info(
+                        'Received SIGTERM, triggering a shutdown.'
+                    )
+                    return WorkerResult.EXIT
+
+                elif signal == ControlSignal.SIGHUP:
+                    self.logger.info('Received SIGHUP, triggering a reload.')
+                    break
+
+                # anything else is left over from the previous worker and is
+                # irrelevant to the next one
+
+            timeout = deadline - time.monotonic()
+        return WorkerResult.RELOAD
+
     @contextmanager
     def _setup_runtime(self):
         with self._start_control():
@@ -258,7 +351,10 @@ def _run_worker(self, worker, logger=None, shutdown_interval=None):
 
     def handle_packet(packet):
         packets.append(packet)
-        os.write(self.control_w, ControlSignal.WORKER_COMMAND)
+        # only wake the main loop for the first packet in a burst, it will
+        # drain the rest of the queue before blocking on the control pipe
+        if len(packets) == 1:
+            os.write(self.control_w, ControlSignal.WORKER_COMMAND)
 
     self.monitor.clear_changes()
 
@@ -286,7 +382,7 @@ def _run_worker(self, worker, logger=None, shutdown_interval=None):
                         # reloading, if it doesn't die then we want to force
                         # reload the app immediately because it probably
                         # didn't die due to some file changes
-                        time.sleep(1)
+                        worker.wait(1)
 
                     if worker.is_alive:
                         logger.info(
@@ -305,7 +401,13 @@ def _run_worker(self, worker, logger=None, shutdown_interval=None):
                     break
 
                 elif cmd[0] == 'watch_files':
-                    for path in cmd[1]:
+                    paths = list(cmd[1])
+
+                    # batch up any other pending file updates
+                    while packets and _is_watch_files(packets[0]):
+                        paths.extend(packets.popleft()[1])
+
+                    for path in paths:
                         self.monitor.add_path(path)
 
                 else:  # pragma: no cover
@@ -373,6 +475,10 @@ def _run_worker(self, worker, logger=None, shutdown_interval=None):
     return result
 
 
+def _is_watch_files(packet):
+    return packet is not None and packet[0] == 'watch_files'
+
+
 def wait_main():
     try:
         reloader = get_reloader()
@@ -1,8 +1,10 @@
 from _thread import interrupt_main
 from importlib.util import source_from_cache
 import os
+import selectors
 import signal
 import site
+import socket
 import sys
 import sysconfig
 import threading
@@ -11,11 +13,20 @@ import traceback
 
 from . import ipc
 from .interfaces import IReloaderProxy
-from .utils import resolve_spec
+from .utils import WIN, resolve_spec
 
 
 class WatchSysModules(threading.Thread):
-    """Poll ``sys.modules`` for imported modules."""
+    """
+    Watch ``sys.modules`` for imported modules.
+
+    ``sys.modules`` is scanned every ``poll_interval`` seconds. Scans are
+    cheap when the number of loaded modules has not changed.
+
+    Extra file descriptors may be registered via :meth:`add_reader` to be
+    serviced by the same thread.
+
+    """
 
     poll_interval = 1
     ignore_system_paths = True
@@ -27,20 +38,99 @@ class WatchSysModules(threading.Thread):
         self.lock = threading.Lock()
         self.stopped = False
         self.system_paths = get_system_paths()
+        self.module_cache = {}
+        self.module_dirs = set()
+        self.module_count = 0
+
+        # a socketpair is used to wake the selector because select() does
+        # not support pipes on windows
+        self.selector = selectors.DefaultSelector()
+        self.wake_r, self.wake_w = socket.socketpair()
+        self.wake_r.setblocking(False)
+        self.selector.register(self.wake_r, selectors.EVENT_READ, self._drain)
+
+    def _wake(self):
+        try:
+            self.wake_w.send(b'\0')
+        except OSError:  # pragma: no cover
+            # the watcher has already shutdown
+            pass
 
-    def run(self):
+    def _drain(self):
+        try:
+            while self.wake_r.recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def add_reader(self, fd, callback):
+        """Invoke ``callback`` from the watcher when ``fd`` is readable."""
+        self.selector.register(fd, selectors.EVENT_READ, callback)
+
+    def remove_reader(self, fd):
+        self.selector.unregister(fd)
+
+    def _select(self, timeout):
+        for key, _ in self.selector.select(timeout):
+            # a failing reader must not stop the others from being serviced,
+            # in particular the control pipe
+            try:
+                key.data()
+            except Exception:
+                traceback.print_exc()
+
+    def _sleep(self, duration):
+        deadline = time.monotonic() + duration
         while not self.stopped:
-            self.update_paths()
-            time.sleep(self.poll_interval)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._select(remaining)
+
+    def run(self):
+        try:
+            while not self.stopped:
+                self._safe_update_paths()
+                self._sleep(self.poll_interval)
+        finally:
+            self.selector.close()
+            self.wake_r.close()
+            self.wake_w.close()
 
     def stop(self):
         self.stopped = True
+        self._wake()
+
+    def _safe_update_paths(self):
+        # the watcher thread also services the control pipe so it must
+        # outlive any errors reporting paths to the reloader
+        try:
+            self.update_paths()
+        except BrokenPipeError:
+            # the reloader has exited, the control pipe will report it
+            pass
+        except Exception:
+            traceback.print_exc()
 
     def update_paths(self):
         """Check sys.modules for paths to add to our path set."""
         new_paths = []
         with self.lock:
-            for path in expand_source_paths(iter_module_paths()):
+            # assume nothing new has been imported if the number of modules
+            # is unchanged since the last scan
+            count = len(sys.modules)
+            if count == self.module_count:
+                return
+            self.module_count = count
+
+            modules = tuple(sys.modules.values())
+            for path in expand_source_paths(
+                iter_module_paths(
+                    modules,
+                    cache=self.module_cache,
+                    known_dirs=self.module_dirs,
+                )
+            ):
                 if path not in self.paths:
                     self.paths.add(path)
                     new_paths.append(path)
@@ -126,17 +216,51 @@ def expand_source_paths(paths):
         yield src_path
 
 
-def iter_module_paths(modules=None):
-    """Yield paths of all imported modules."""
-    modules = modules or list(sys.modules.values())
+MODULE_EXTENSIONS = ('.py', '.pyc', '.pyo', '.so', '.pyd')
+
+
+def iter_module_paths(modules=None, cache=None, known_dirs=None):
+    """
+    Yield paths of all imported modules.
+
+    If ``cache`` is a dict then it will be used to remember which modules
+    have already been inspected and they will be skipped on later calls.
+
+    If ``known_dirs`` is a set then it will be used to remember folders
+    containing modules. Source and extension modules in those folders are
+    assumed to exist without checking the filesystem.
+
+    """
+    if modules is None:
+        modules = tuple(sys.modules.values())
+    # resolve the cwd at most once instead of once per relative path
+    cwd = None
     for module in modules:
         try:
             filename = module.__file__
         except (AttributeError, ImportError):  # pragma: no cover
             continue
+        if cache is not None:
+            key = id(module)
+            if key in cache and cache[key] == filename:
+                continue
+            cache[key] = filename
         if filename is not None:
-            abs_filename = os.path.abspath(filename)
+            if not os.path.isabs(filename):
+                if cwd is None:
+                    cwd = os.getcwd()
+                filename = os.path.join(cwd, filename)
+            abs_filename = os.path.normpath(filename)
+            if known_dirs is not None:
+                dirname = os.path.dirname(abs_filename)
+                if dirname in known_dirs and abs_filename.endswith(
+                    MODULE_EXTENSIONS
+                ):
+                    yield abs_filename
+                    continue
             if os.path.isfile(abs_filename):
+                if known_dirs is not None:
+                    known_dirs.add(dirname)
                 yield abs_filename
 
 
@@ -232,23 +356,76 @@ def is_active():
 
 
 class ReloaderProxy(IReloaderProxy):
+    """
+    Forward requests from the worker to the reloader process.
+
+    Files are buffered for up to ``flush_interval`` seconds, or until
+    ``max_pending_files`` are queued, and then sent as a single packet.
+
+    """
+
+    flush_interval = 0.05
+    max_pending_files = 128
+
     def __init__(self, pipe):
         self.pipe = pipe
+        self.lock = threading.Lock()
+        self.pending_files = []
+        self.flush_timer = None
 
     def watch_files(self, files):
         files = [os.path.abspath(f) for f in files]
-        self.pipe.send(('watch_files', files))
+        with self.lock:
+            self.pending_files.extend(files)
+            if len(self.pending_files) >= self.max_pending_files:
+                self._flush()
+            elif self.flush_timer is None:
+                self.flush_timer = threading.Timer(
+                    self.flush_interval, self.flush
+                )
+                self.flush_timer.daemon = True
+                self.flush_timer.start()
 
     def trigger_reload(self):
-        self.pipe.send(('reload',))
+        with self.lock:
+            # send any pending files first so they are watched after the
+            # reload
+            self._flush()
+            self.pipe.send(('reload',))
+
+    def flush(self):
+        """Send any pending files to the reloader."""
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        if self.flush_timer is not None:
+            self.flush_timer.cancel()
+            self.flush_timer = None
+        if self.pending_files:
+            files, self.pending_files = self.pending_files, []
+            self.pipe.send(('watch_files', files))
 
 
-def watch_control_pipe(pipe):
+def watch_control_pipe(pipe, poller):
     def handle_packet(packet):
         if packet is None:
             interrupt_main()
 
-    pipe.activate(handle_packet)
+    def on_readable():
+        # the reloader never sends anything to the worker, the pipe is only
+        # used to detect when the reloader has exited
+        if not os.read(pipe.r_fd, 4096):
+            poller.remove_reader(pipe.r_fd)
+            handle_packet(None)
+
+    if WIN:  # pragma: no cover
+        # select() does not support pipes on windows so fallback to watching
+        # the pipe from a separate thread
+        pipe.activate(handle_packet)
+    else:
+        pipe.activate()
+        poller.add_reader(pipe.r_fd, on_readable)
 
 
 def worker_main(spec, pipe, spec_args=None, spec_kwargs=None):
@@ -257,9 +434,6 @@ def worker_main(spec, pipe, spec_args=None, spec_kwargs=None):
     if spec_kwargs is None:
         spec_kwargs = {}
 
-    # activate the pipe after forking
-    watch_control_pipe(pipe)
-
     # SIGHUP is not supported on windows
     if hasattr(signal, 'SIGHUP'):
         signal.signal(signal.SIGHUP, signal.SIG_IGN)
@@ -273,6 +447,10 @@ def worker_main(spec, pipe, spec_args=None, spec_kwargs=None):
 
     poller = WatchSysModules(_reloader_proxy.watch_files)
     poller.daemon = True
+
+    # activate the pipe after forking
+    watch_control_pipe(pipe, poller)
+
     poller.start()
 
     # import the worker path before polling sys.modules
@@ -293,6 +471,7 @@ def worker_main(spec, pipe, spec_args=None, spec_kwargs=None):
             # attempt to send imported paths to the reloader process prior to
             # closing
             poller.update_paths()
+            _reloader_proxy.flush()
             poller.stop()
             poller.join()
         except Exception:  # pragma: no cover
@@ -0,0 +1,32 @@
+import pytest
+
+from hupper.logger import DefaultLogger, LogLevel
+
+
+def log_all(logger):
+    logger.error('e')
+    logger.info('i')
+    logger.debug('d')
+
+
+@pytest.mark.parametrize(
+    'level, expected',
+    [
+        (LogLevel.ERROR, ['[ERROR] e']),
+        (LogLevel.INFO, ['[ERROR] e', 'i']),
+        (LogLevel.DEBUG, ['[ERROR] e', 'i', '[DEBUG] d']),
+    ],
+)
+def test_default_logger_levels(capsys, level, expected):
+    log_all(DefaultLogger(level))
+    out, err = capsys.readouterr()
+    assert out == ''
+    assert err.splitlines() == expected
+
+
+def test_default_logger_level_can_change(capsys):
+    logger = DefaultLogger(LogLevel.ERROR)
+    logger.level = LogLevel.DEBUG
+    log_all(logger)
+    _, err = capsys.readouterr()
+    assert err.splitlines() == ['[ERROR] e', 'i', '[DEBUG] d']
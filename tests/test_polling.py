@@ -0,0 +1,28 @@
+def make_monitor(logger, max_paths=3):
+    from hupper.polling import PollingFileMonitor
+
+    monitor = PollingFileMonitor(lambda path: None, logger=logger)
+    monitor.max_paths_warning = max_paths
+    return monitor
+
+
+def test_warns_once_when_polling_many_files(logger):
+    monitor = make_monitor(logger)
+    for i in range(3):
+        monitor.add_path('/{}.py'.format(i))
+    assert logger.get_output() == ''
+
+    for i in range(3, 6):
+        monitor.add_path('/{}.py'.format(i))
+    out = logger.get_output('info')
+    assert out == (
+        'Polling 4 files for changes, install watchdog '
+        '("pip install watchdog") for a more efficient file monitor.'
+    )
+
+
+def test_no_warning_without_logger():
+    monitor = make_monitor(None)
+    for i in range(6):
+        monitor.add_path('/{}.py'.format(i))
+    assert monitor.warned is False
@@ -1,4 +1,8 @@
 import os
+import pytest
+import time
+
+from hupper.utils import WIN
 
 here = os.path.abspath(os.path.dirname(__file__))
 
@@ -82,23 +86,46 @@ def test_proxy_tracks_changes(logger):
     cb = DummyCallback()
     monitor = DummyMonitor()
     proxy = make_proxy(monitor, cb, logger)
+    proxy.debounce_interval = 60
     monitor.cb('foo.txt')
+    proxy.flush_changes()
     assert cb.called == {'foo.txt'}
     out = logger.get_output('info')
     assert out == 'foo.txt changed; reloading ...'
     logger.reset()
     monitor.cb('foo.txt')
+    proxy.flush_changes()
     out = logger.get_output('info')
     assert out == ''
     logger.reset()
     cb.called = False
     proxy.clear_changes()
     monitor.cb('foo.txt')
+    proxy.flush_changes()
     out = logger.get_output('info')
     assert out == 'foo.txt changed; reloading ...'
     logger.reset()
 
 
+def test_proxy_debounces_changes(logger):
+    class DummyMonitor(object):
+        def __call__(self, cb, **kw):
+            self.cb = cb
+            return self
+
+    cb = DummyCallback()
+    monitor = DummyMonitor()
+    proxy = make_proxy(monitor, cb, logger)
+    proxy.debounce_interval = 60
+    monitor.cb('foo.txt')
+    monitor.cb('bar.txt')
+    monitor.cb('foo.txt')
+    proxy.flush_changes()
+    assert cb.called == {'foo.txt', 'bar.txt'}
+    out = logger.get_output('info')
+    assert out == '2 files changed (first: foo.txt); reloading ...'
+
+
 def test_ignore_files():
     class DummyMonitor(object):
         paths = set()
@@ -121,3 +148,131 @@ def test_ignore_files():
     assert path not in monitor.paths
     proxy.add_path(path)
     assert path not in monitor.paths
+
+
+@pytest.fixture
+def control_reloader(logger):
+    from hupper.reloader import Reloader
+
+    reloader = Reloader('x', None, logger)
+    reloader.control_r, reloader.control_w = os.pipe()
+    try:
+        yield reloader
+    finally:
+        os.close(reloader.control_r)
+        os.close(reloader.control_w)
+
+
+@pytest.mark.skipif(WIN, reason='select() does not support pipes')
+def test_throttle_exits_on_sigterm(control_reloader, logger):
+    from hupper.reloader import ControlSignal, WorkerResult
+
+    os.write(control_reloader.control_w, ControlSignal.SIGTERM)
+    assert control_reloader._throttle(5) == WorkerResult.EXIT
+    out = logger.get_output('info')
+    assert out == 'Received SIGTERM, triggering a shutdown.'
+
+
+@pytest.mark.skipif(WIN, reason='select() does not support pipes')
+def test_throttle_reloads_early_on_sighup(control_reloader, logger):
+    from hupper.reloader import ControlSignal, WorkerResult
+
+    # stale signals from the previous worker are ignored
+    os.write(control_reloader.control_w, ControlSignal.FILE_CHANGED)
+    os.write(control_reloader.control_w, ControlSignal.SIGHUP)
+    start = time.monotonic()
+    assert control_reloader._throttle(5) == WorkerResult.RELOAD
+    assert time.monotonic() - start < 5
+    out = logger.get_output('info')
+    assert out == 'Received SIGHUP, triggering a reload.'
+
+
+def test_throttle_waits_without_signals(control_reloader):
+    from hupper.reloader import WorkerResult
+
+    start = time.monotonic()
+    assert control_reloader._throttle(0.1) == WorkerResult.RELOAD
+    assert time.monotonic() - start >= 0.1
+
+
+class DummyWorker:
+    pid = 1
+    exitcode = 0
+    is_alive = False
+
+    def __init__(self, packets):
+        self.packets = packets
+
+    def start(self, on_packet):
+        for packet in self.packets:
+            on_packet(packet)
+
+    def wait(self, timeout=None):
+        pass
+
+    def join(self):
+        pass
+
+
+class DummyMonitorProxy:
+    is_changed = False
+
+    def __init__(self):
+        self.paths = []
+
+    def clear_changes(self):
+        pass
+
+    def add_path(self, path):
+        self.paths.append(path)
+
+
+def read_control_bytes(reloader):
+    # drain the control pipe up to a sentinel without blocking
+    os.write(reloader.control_w, b'\xff')
+    data = b''
+    while True:
+        byte = os.read(reloader.control_r, 1)
+        if byte == b'\xff':
+            return data
+        data += byte
+
+
+def test_run_worker_batches_file_packets(control_reloader, logger):
+    from hupper.reloader import ControlSignal, WorkerResult, _run_worker
+
+    control_reloader.monitor = DummyMonitorProxy()
+    worker = DummyWorker(
+        [
+            ('watch_files', ['a']),
+            ('watch_files', ['b']),
+            ('reload',),
+            ('watch_files', ['c']),
+        ]
+    )
+    assert _run_worker(control_reloader, worker) == WorkerResult.RELOAD
+    assert control_reloader.monitor.paths == ['a', 'b']
+    assert logger.get_output('debug').count('"watch_files"') == 1
+    # only the first packet in the burst wakes the main loop
+    assert read_control_bytes(control_reloader) == (
+        ControlSignal.WORKER_COMMAND
+    )
+
+
+def test_run_worker_stops_batching_at_closed_pipe(control_reloader, logger):
+    from hupper.reloader import WorkerResult, _run_worker
+
+    control_reloader.monitor = DummyMonitorProxy()
+    worker = DummyWorker(
+        [
+            ('watch_files', ['a']),
+            ('watch_files', ['b']),
+            None,
+            ('watch_files', ['c']),
+        ]
+    )
+    assert _run_worker(control_reloader, worker) == WorkerResult.WAIT
+    assert control_reloader.monitor.paths == ['a', 'b', 'c']
+    # the packets after the closed pipe are handled as a separate batch
+    assert logger.get_output('debug').count('"watch_files"') == 2
+    assert read_control_bytes(control_reloader) == b''
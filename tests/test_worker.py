@@ -0,0 +1,239 @@
+import importlib
+import os
+import pytest
+import sys
+import time
+
+from hupper.utils import WIN
+
+
+class DummyCallback:
+    def __init__(self):
+        self.paths = []
+
+    def __call__(self, paths):
+        self.paths.extend(paths)
+
+
+def wait_until(predicate, timeout=5, interval=0.01):
+    start = time.monotonic()
+    while not predicate():
+        if time.monotonic() - start >= timeout:  # pragma: no cover
+            return False
+        time.sleep(interval)
+    return True
+
+
+@pytest.fixture
+def watcher():
+    from hupper.worker import WatchSysModules
+
+    watchers = []
+
+    def factory(callback):
+        w = WatchSysModules(callback)
+        w.poll_interval = 0.05
+        w.ignore_system_paths = False
+        w.daemon = True
+        watchers.append(w)
+        return w
+
+    try:
+        yield factory
+    finally:
+        for w in watchers:
+            w.stop()
+            if w.is_alive():
+                w.join()
+            else:
+                # run() cleans up the selector if the thread was started
+                w.selector.close()
+                w.wake_r.close()
+                w.wake_w.close()
+
+
+def test_watcher_finds_modules_loaded_with_import_module(
+    tmpdir, monkeypatch, watcher
+):
+    tmpdir.join('hupper_test_plugin_a.py').write('value = 1\n')
+    monkeypatch.syspath_prepend(tmpdir.strpath)
+    monkeypatch.delitem(sys.modules, 'hupper_test_plugin_a', raising=False)
+
+    cb = DummyCallback()
+    w = watcher(cb)
+    w.start()
+    # wait for the initial scan to finish before importing
+    assert wait_until(lambda: w.module_count > 0)
+
+    importlib.import_module('hupper_test_plugin_a')
+    path = os.path.join(tmpdir.strpath, 'hupper_test_plugin_a.py')
+    assert wait_until(lambda: path in cb.paths)
+
+
+@pytest.mark.skipif(WIN, reason='select() does not support pipes')
+def test_watcher_services_readers_after_callback_errors(watcher):
+    def callback(paths):
+        # simulate the reloader exiting while paths are sent
+        raise BrokenPipeError
+
+    w = watcher(callback)
+    r, wfd = os.pipe()
+    closed = []
+
+    def on_readable():
+        if not os.read(r, 4096):
+            w.remove_reader(r)
+            closed.append(True)
+
+    w.add_reader(r, on_readable)
+    w.start()
+    try:
+        os.close(wfd)
+        assert wait_until(lambda: closed)
+        assert w.is_alive()
+    finally:
+        os.close(r)
+
+
+@pytest.mark.skipif(WIN, reason='select() does not support pipes')
+def test_watcher_services_readers_after_reader_errors(watcher):
+    w = watcher(DummyCallback())
+    bad_r, bad_w = os.pipe()
+    r, wfd = os.pipe()
+    failed, closed = [], []
+
+    def on_bad_readable():
+        w.remove_reader(bad_r)
+        failed.append(True)
+        raise RuntimeError('boom')
+
+    def on_readable():
+        if not os.read(r, 4096):
+            w.remove_reader(r)
+            closed.append(True)
+
+    w.add_reader(bad_r, on_bad_readable)
+    w.add_reader(r, on_readable)
+    w.start()
+    try:
+        os.write(bad_w, b'x')
+        assert wait_until(lambda: failed)
+        os.close(wfd)
+        assert wait_until(lambda: closed)
+        assert w.is_alive()
+    finally:
+        for fd in (bad_r, bad_w, r):
+            os.close(fd)
+
+
+class DummyModule:
+    def __init__(self, filename):
+        self.__file__ = filename
+
+
+def test_iter_module_paths_skips_cached_modules(tmpdir):
+    from hupper.worker import iter_module_paths
+
+    foo = tmpdir.join('foo.py').ensure().strpath
+    bar = tmpdir.join('bar.py').ensure().strpath
+    module = DummyModule(foo)
+    cache = {}
+    assert list(iter_module_paths([module], cache=cache)) == [foo]
+    assert list(iter_module_paths([module], cache=cache)) == []
+
+    module.__file__ = bar
+    assert list(iter_module_paths([module], cache=cache)) == [bar]
+
+
+def test_iter_module_paths_skips_isfile_in_known_dirs(tmpdir, monkeypatch):
+    from hupper.worker import iter_module_paths
+
+    foo = tmpdir.join('foo.py').ensure().strpath
+    bar = tmpdir.join('bar.py').strpath
+    data = tmpdir.join('data.txt').strpath
+    known_dirs = set()
+    assert list(
+        iter_module_paths([DummyModule(foo)], known_dirs=known_dirs)
+    ) == [foo]
+    assert known_dirs == {tmpdir.strpath}
+
+    checked = []
+
+    def isfile(path):
+        checked.append(path)
+        return False
+
+    monkeypatch.setattr(os.path, 'isfile', isfile)
+    modules = [DummyModule(bar), DummyModule(data)]
+    assert list(iter_module_paths(modules, known_dirs=known_dirs)) == [bar]
+    # only the non-module file in the known folder hits the filesystem
+    assert checked == [data]
+
+
+def test_update_paths_skips_scan_when_module_count_unchanged(
+    tmpdir, monkeypatch, watcher
+):
+    cb = DummyCallback()
+    w = watcher(cb)
+
+    foo = tmpdir.join('hupper_test_count.py').ensure().strpath
+    monkeypatch.setitem(sys.modules, 'hupper_test_count', DummyModule(foo))
+    # pretend the last scan already saw this many modules
+    w.module_count = len(sys.modules)
+    w.update_paths()
+    assert cb.paths == []
+
+    w.module_count -= 1
+    w.update_paths()
+    assert foo in cb.paths
+    assert w.module_count == len(sys.modules)
+
+
+class DummyPipe:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, value):
+        self.sent.append(value)
+
+
+def test_reloader_proxy_buffers_files():
+    from hupper.worker import ReloaderProxy
+
+    pipe = DummyPipe()
+    proxy = ReloaderProxy(pipe)
+    proxy.flush_interval = 60
+    files = [os.path.abspath('a.py'), os.path.abspath('b.py')]
+    proxy.watch_files(files)
+    assert pipe.sent == []
+    proxy.flush()
+    assert pipe.sent == [('watch_files', files)]
+    proxy.flush()
+    assert len(pipe.sent) == 1
+
+
+def test_reloader_proxy_sends_full_buffer_immediately():
+    from hupper.worker import ReloaderProxy
+
+    pipe = DummyPipe()
+    proxy = ReloaderProxy(pipe)
+    proxy.flush_interval = 60
+    files = [
+        os.path.abspath('{}.py'.format(i))
+        for i in range(proxy.max_pending_files)
+    ]
+    proxy.watch_files(files)
+    assert pipe.sent == [('watch_files', files)]
+    assert proxy.flush_timer is None
+
+
+def test_reloader_proxy_flushes_before_reload():
+    from hupper.worker import ReloaderProxy
+
+    pipe = DummyPipe()
+    proxy = ReloaderProxy(pipe)
+    proxy.flush_interval = 60
+    files = [os.path.abspath('a.py')]
+    proxy.watch_files(files)
+    proxy.trigger_reload()
+    assert pipe.sent == [('watch_files', files), ('reload',)]
@@ -89,10 +89,10 @@ def readfile(path):
 
 
 def wait_for_change(path, last_size=0, timeout=5, interval=0.1):
-    start = time.time()
+    start = time.monotonic()
     size = os.path.getsize(path)
     while size == last_size:
-        duration = time.time() - start
+        duration = time.monotonic() - start
         sleepfor = interval
         if timeout is not None:  # pragma: no cover
             if duration >= timeout: